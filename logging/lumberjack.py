@@ -31,8 +31,9 @@ class FileHandler(logging.FileHandler):
         """
         # Creates the parent directory before attempting to return the file
         # stream, if one doesn't exist.
-        if not os.path.isdir(os.path.dirname(self.baseFilename)):
-            os.makedirs(os.path.dirname(self.baseFilename))
+        dirname = os.path.dirname(self.baseFilename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
         return super(FileHandler, self)._open()
 
 
@@ -47,7 +48,8 @@ import inspect
 import enum
 import time
 import os
-import glob
+import heapq
+import threading
 
 from python_utils import caching
 from python_utils import inspections
@@ -86,6 +88,18 @@ class BaseLoggerAdapter(logging.LoggerAdapter):
         self.base_logger = base_logger
         super(BaseLoggerAdapter, self).__init__(base_logger, extra)
 
+    def process(self, msg, kwargs):
+        """Attach the calling dependency stack to every record.
+
+        The stack is captured once per logging call, so every StackFilter
+        the record passes through can reuse it.
+        """
+        extra = dict(self.extra)
+        extra.update(kwargs.get("extra") or {})
+        extra["calling_stack"] = frozenset(_enclosing_modules())
+        kwargs["extra"] = extra
+        return msg, kwargs
+
     def addHandler(self, handler):
         self.logger.addHandler(handler)
 
@@ -185,21 +199,23 @@ class Interval(enum.Enum):
     MIDNIGHT = 12
 
 
-#: (dict) Maps between a standard interval and args for the logging module
-_interval_map = {
-    Interval.HOUR: ("H", 1),
-    Interval.DAY: ("D", 1),
-    Interval.WEEK: ("D", 7),
-    Interval.MONTH: ("D", 30),
-    Interval.MONDAY: ("W0", 1),
-    Interval.TUESDAY: ("W1", 1),
-    Interval.WEDNESDAY: ("W2", 1),
-    Interval.THURSDAY: ("W3", 1),
-    Interval.FRIDAY: ("W4", 1),
-    Interval.SATURDAY: ("W5", 1),
-    Interval.SUNDAY: ("W6", 1),
-    Interval.MIDNIGHT: ("midnight", 1)
-}
+#: (tuple) Maps between a standard interval and args for the logging module,
+#: indexed by Interval value
+_interval_map = (
+    None,               # Interval.NEVER
+    ("H", 1),           # Interval.HOUR
+    ("D", 1),           # Interval.DAY
+    ("D", 7),           # Interval.WEEK
+    ("D", 30),          # Interval.MONTH
+    ("W6", 1),          # Interval.SUNDAY
+    ("W0", 1),          # Interval.MONDAY
+    ("W1", 1),          # Interval.TUESDAY
+    ("W2", 1),          # Interval.WEDNESDAY
+    ("W3", 1),          # Interval.THURSDAY
+    ("W4", 1),          # Interval.FRIDAY
+    ("W5", 1),          # Interval.SATURDAY
+    ("midnight", 1),    # Interval.MIDNIGHT
+)
 
 
 # LOG FORMATTING
@@ -246,28 +262,39 @@ def log_formatter(date=False, name=False, path=False, module=False,
 
     """
 
-    # The process here takes advantage of a python quirk:  Multiplying any
-    # string by 0 returns an empty string. This makes for a pretty clean
-    # way to build complex strings with lots of optional arguments.
-    fmt_str = (
-        ("%(asctime)s | " * (date or time))
-        + ("%(levelname)s | " * severity)
-        + ("%(name)s | " * name)
-        + ("%(pathname)s | " * (path and not line and not module))
-        + ("%(pathname)s, line %(lineno)d | " * (path and line and not module))
-        + ("%(module)s | " * (module and not path and not line))
-        + ("%(module)s, line %(lineno)d | " * (module and not path and line))
-        + ("%(funcName)s() | " * function)
-        + ("%(message)s")
-    )
-
-    strfmt_str = (
-        ("%b %d %Y" * date)
-        + (" %I:%M" * (time))
-        + (":%S" * (time and seconds))
-        + (".%f" * (time and milliseconds))
-        + (" %p" * time)
-    )
+    parts = []
+    if date or time:
+        parts.append("%(asctime)s | ")
+    if severity:
+        parts.append("%(levelname)s | ")
+    if name:
+        parts.append("%(name)s | ")
+    if path and not module:
+        if line:
+            parts.append("%(pathname)s, line %(lineno)d | ")
+        else:
+            parts.append("%(pathname)s | ")
+    elif module and not path:
+        if line:
+            parts.append("%(module)s, line %(lineno)d | ")
+        else:
+            parts.append("%(module)s | ")
+    if function:
+        parts.append("%(funcName)s() | ")
+    parts.append("%(message)s")
+    fmt_str = "".join(parts)
+
+    date_parts = []
+    if date:
+        date_parts.append("%b %d %Y")
+    if time:
+        date_parts.append(" %I:%M")
+        if seconds:
+            date_parts.append(":%S")
+        if milliseconds:
+            date_parts.append(".%f")
+        date_parts.append(" %p")
+    strfmt_str = "".join(date_parts)
 
     return LogFormatter(fmt_str, strfmt_str)
 
@@ -322,12 +349,15 @@ def detail_formatter():
                             seconds=True, milliseconds=True)
 
 
-_formatter_map = \
-    {Formatters.BASIC: basic_formatter,
-     Formatters.DATED: dated_formatter,
-     Formatters.DETAIL: detail_formatter,
-     Formatters.TIMESTAMP: timestamp_formatter,
-     }
+#: (tuple) Maps between a standard formatter and its builder, indexed by
+#: Formatters value
+_formatter_map = (
+    None,
+    basic_formatter,        # Formatters.BASIC
+    dated_formatter,        # Formatters.DATED
+    detail_formatter,       # Formatters.DETAIL
+    timestamp_formatter,    # Formatters.TIMESTAMP
+)
 
 
 # FILTERING
@@ -355,13 +385,13 @@ class StackFilter(logging.Filter):
         super(StackFilter, self).__init__()
 
     def filter(self, record):
-        # if the LogRecord has not gone through a StackFilter before, we
-        # grab the dependency hierarchy and attach it to the record for
-        # efficiency
+        # records logged through a BaseLoggerAdapter already carry their
+        # dependency hierarchy; anything logged straight to a logger gets
+        # it attached here, once
         try:
             calling_stack = record.calling_stack
         except AttributeError:
-            calling_stack = set(_enclosing_modules())
+            calling_stack = frozenset(_enclosing_modules())
             record.calling_stack = calling_stack
 
         # This is where the magic happens!
@@ -448,15 +478,14 @@ class BasicFileLogHandler(logging.handlers.TimedRotatingFileHandler):
             ext=extension
         )
 
-        if os.path.exists(rotated_filename):
-            os.remove(rotated_filename)
-
+        # os.replace overwrites any existing rotated file atomically
         if os.path.exists(self.baseFilename):
-            os.rename(self.baseFilename, rotated_filename)
+            os.replace(self.baseFilename, rotated_filename)
 
+        # Pruning old backups means scanning the log directory, so it's done
+        # off the logging thread.
         if self.backupCount > 0:
-            for s in self.getFilesToDelete():
-                os.remove(s)
+            threading.Thread(target=self.remove_old_backups, daemon=True).start()
 
         self.stream = self._open()
 
@@ -488,17 +517,35 @@ class BasicFileLogHandler(logging.handlers.TimedRotatingFileHandler):
         if self.backupCount == 0:
             return []
         base_file_name, extension = os.path.splitext(self.baseFilename)
-        expand_file_name = self.rotated_file_format.format(
-            base=base_file_name, timestamp="*", ext=extension
-        )
-        backups = glob.glob(expand_file_name)
-        n_backups = len(backups)
-        if n_backups > self.backupCount:
-            backups.sort()
-            return backups[:(n_backups - self.backupCount)]
+        directory, base_name = os.path.split(base_file_name)
+
+        # Rotated files are named "{base}.{timestamp}{ext}"; a prefix/suffix
+        # check on the directory listing is all the matching we need.
+        prefix = base_name + "."
+        min_length = len(prefix) + len(extension)
+        backups = []
+        with os.scandir(directory or os.curdir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (len(name) >= min_length
+                        and name.startswith(prefix)
+                        and name.endswith(extension)):
+                    backups.append(entry.path)
+
+        n_excess = len(backups) - self.backupCount
+        if n_excess > 0:
+            return heapq.nsmallest(n_excess, backups)
         else:
             return []
 
+    def remove_old_backups(self):
+        """Deletes rotated files in excess of backupCount."""
+        for file_name in self.getFilesToDelete():
+            try:
+                os.remove(file_name)
+            except FileNotFoundError:
+                pass
+
     def close_stream(self):
         if self.stream:
             self.stream.close()
@@ -521,7 +568,7 @@ def _configure_and_add_handler(handler, severity, formatter):
 
     # add a standardized formatter
     elif isinstance(formatter, enum.Enum):
-        formatter = _formatter_map[formatter]()
+        formatter = _formatter_map[formatter.value]()
 
     # if neither is true, formatter is assumed to be a Formatter instance
 
@@ -586,7 +633,7 @@ def add_file_output(filename, severity=logging.NOTSET, formatter=None,
     if rotate_every == Interval.NEVER:
         handler = FileHandler(filename, encoding=encoding)
     else:
-        when, interval = _interval_map[rotate_every]
+        when, interval = _interval_map[rotate_every.value]
         handler = BasicFileLogHandler(
             filename,
             when=when,
@@ -609,7 +656,7 @@ def get_all_base_handlers():
 
 def get_valid_base_handlers():
     """Returns a list of valid handlers for the current execution stack."""
-    calling_stack = set(_enclosing_modules())
+    calling_stack = frozenset(_enclosing_modules())
     handlers = get_base_logger().handlers
     valid_handlers = list()
     for handler in handlers:
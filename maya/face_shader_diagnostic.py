@@ -12,38 +12,49 @@ def bad_meshes_and_shaders():
     "multi_shaded" face_shaded nodes can be safely re-applied with the same
     shader on any of their faces, but multi_shaded nodes have multiple shaders
     on different faces, and cannot be trivially fixed"""
-    result = dict()
-
     # these are nodes with at least two shaders attached to them,
     # even two of the same shader
     per_faces = per_face_shaded()
 
-    # these are nodes with at least two different shaders attached
-    multis = multi_shaded(per_faces)
-
-    # reorganizes the multi-shaded nodes and culls the ones with only
-    # duplicates of the same shader attached
-    multi_shaded_result = shaders_by_obj(multis, cull=True)
-    result['multi_shaded'] = multi_shaded_result
-
-    # reorganize per_faces and only include nodes with a single shader
-    face_shaded_result = {key: value for key, value
-                          in shaders_by_obj(per_faces).items()
-                          if key not in multi_shaded_result}
-    result['face_shaded'] = face_shaded_result
+    # group every shader by object in a single pass, tracking separately the
+    # shaders attached to partial face ranges -- those are the candidates for
+    # genuine multi-shading
+    all_shaders = defaultdict(set)
+    partial_shaders = defaultdict(set)
+    for sg, node, obj in per_faces:
+        all_shaders[obj].add(sg)
+        if face_count(obj) != parse_facet_range(node):
+            partial_shaders[obj].add(sg)
+
+    # nodes with at least two different shaders on partial face ranges are
+    # multi-shaded; everything else can be re-applied with a single shader
+    multi_shaded_result = dict()
+    face_shaded_result = dict()
+    for obj, sgs in all_shaders.items():
+        partial = partial_shaders.get(obj, ())
+        if len(partial) > 1:
+            multi_shaded_result[obj] = tuple(partial)
+        elif len(sgs) == 1:
+            face_shaded_result[obj] = next(iter(sgs))
+        else:
+            face_shaded_result[obj] = tuple(sgs)
 
-    return result
+    return {'multi_shaded': multi_shaded_result,
+            'face_shaded': face_shaded_result}
 
 
 def per_face_shaded():
     """get all nodes with any kind of per-face shading"""
-    # get all the shading assignments in the scene.
+    # get all the shading assignments in the scene.  Each entry is a
+    # (shading group, face component, transform) triple, so consumers don't
+    # have to re-split the component string to find the owning object.
     sg_nodes = {sg: (cmds.sets(sg, query=True) or [])
                 for sg in cmds.ls(type='shadingEngine')}
     sg_and_meshes = []
     for sg, nodes in sg_nodes.items():
         # get the nodes with face-based shading
-        bad = [(sg, node) for node in nodes if '.f[' in node]
+        bad = [(sg, node, node.partition('.f[')[0])
+               for node in nodes if '.f[' in node]
         sg_and_meshes.extend(bad)
     return sg_and_meshes
 
@@ -52,21 +63,20 @@ def multi_shaded(per_face_shaded_nodes=None):
     """get all nodes with shaders attached to multiple groups of faces"""
     meshes = []
     per_face_shaded_nodes = per_face_shaded_nodes or per_face_shaded()
-    for sg, node in per_face_shaded():
+    for sg, node, obj in per_face_shaded_nodes:
         shading_face_count = parse_facet_range(node)
-        if face_count(node.split('.f[')[0]) != shading_face_count:
-            meshes.append((sg, node))
+        if face_count(obj) != shading_face_count:
+            meshes.append((sg, node, obj))
     return meshes
 
 
 def shaders_by_obj(nodes=None, cull=False):
-    """Reorganize a collection of (shader, node) pairs into a dict with
+    """Reorganize a collection of (shader, node, obj) triples into a dict with
     unique nodes as keys and unique shaders as values.  If cull is True,
     only multi-shaded nodes will be included"""
     nodes = nodes or multi_shaded()
     result_finder = defaultdict(set)
-    for sg, obj in nodes:
-        obj = obj.split('.f[')[0]
+    for sg, _, obj in nodes:
         result_finder[obj].add(sg)
     result = dict()
     for key, value in result_finder.items():
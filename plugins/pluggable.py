@@ -32,11 +32,17 @@ Example:
 import abc
 import os
 import importlib
+import importlib.machinery
 import importlib.util
 import inspect
 import pkgutil
+import sys
+import types
+from collections.abc import Hashable
 from pathlib import Path
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, update_wrapper
+from itertools import chain
 
 from typing import Callable, Iterable, List, Optional, Iterable, Tuple, Dict
 
@@ -45,29 +51,13 @@ from python_utils.inspections import membership
 
 
 __all__ = ["Plugin", "PluginManager", "in_dir", "in_module", "in_plugins_dir",
-           "in_package", "finder_callback"]
+           "in_package", "finder_callback", "clear_finder_cache"]
 
 
 # type alias -- a function that returns a list of plugins
 Finder = Callable[..., Iterable["Plugin"]]
 
 
-class AbstractAttribute:
-    """An abstract class attribute.
-
-    Use this in an abstract base class when an attribute MUST be overridden by
-    subclasses, and is not intended to be used as a property.
-    """
-
-    __isabstractmethod__ = True
-
-    def __init__(self, doc: str=""):
-        self.__doc__ = doc
-
-    def __get__(self, obj, cls):
-        return self
-
-
 class Plugin(metaclass=abc.ABCMeta):
     """Defines the design contract for plugin objects.
 
@@ -88,7 +78,13 @@ class Plugin(metaclass=abc.ABCMeta):
 
     """
 
-    name = AbstractAttribute("The unique name of your plugin")
+    # Plugin itself adds no per-instance storage; subclasses that only use
+    # class-level attributes can declare empty __slots__ to stay dict-free.
+    __slots__ = ()
+
+    #: The unique name of your plugin.  Classes and objects whose name is
+    #: None are not treated as plugins.
+    name: Optional[str] = None
 
     #: An optional value that can be used to sort the plugin if ordering is
     #: important.
@@ -122,16 +118,37 @@ class Plugin(metaclass=abc.ABCMeta):
         Args:
             obj (callable)
         """
-        try:
-            return (
-                # type(obj) is not type  # prevents plugin classes from being plugins
-                obj is not Plugin
-                and all(callable(x) for x in (obj.load, obj.run, obj.unload))
-                and obj.name is not None
-            )
-        except AttributeError:
+        if obj is Plugin:
             return False
 
+        # Classes are checked against the contract by __subclasshook__, and
+        # abc caches the answer for each class.
+        if inspect.isclass(obj):
+            return issubclass(obj, Plugin) and _has_class_name(obj)
+        if isinstance(obj, Plugin):
+            return getattr(obj, "name", None) is not None
+
+        # Modules and other objects may satisfy the contract with attributes
+        # of their own rather than of their class.
+        return (
+            getattr(obj, "name", None) is not None
+            and callable(getattr(obj, "load", None))
+            and callable(getattr(obj, "run", None))
+            and callable(getattr(obj, "unload", None))
+        )
+
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        """Treats any class that fits the plugin design contract as a
+        virtual subclass of Plugin."""
+        if cls is Plugin:
+            mro = subclass.__mro__
+            if (_has_class_name(subclass)
+                    and all(any(attr in base.__dict__ for base in mro)
+                            for attr in ("load", "run", "unload"))):
+                return True
+        return NotImplemented
+
     def __repr__(self):
         """Code representation of the Plugin:
         <Plugin "name" at 0x0000>
@@ -142,6 +159,44 @@ class Plugin(metaclass=abc.ABCMeta):
             hex_id=hex(id(self))
         )
 
+
+def _has_class_name(cls):
+    """True if the class itself sets a name.
+
+    A class that only declares "name" in its __slots__ gets a member
+    descriptor rather than a name; its instances may be plugins, but the
+    class itself is not.
+    """
+    name = getattr(cls, "name", None)
+    return name is not None and not isinstance(name, types.MemberDescriptorType)
+
+
+class _FactoryPlugin(Plugin):
+    """A Plugin that delegates to plain callables.  See make_plugin."""
+
+    __slots__ = ("name", "order", "_runner", "_loader", "_unloader")
+
+    def __init__(self, runner, loader=None, unloader=None, name=None,
+                 order=None):
+        self._runner = runner
+        self._loader = loader
+        self._unloader = unloader
+        self.name = name or runner.__name__
+        if order is not None:
+            self.order = order
+
+    def load(self, manager):
+        if self._loader is not None:
+            self._loader(manager)
+
+    def unload(self, manager):
+        if self._unloader is not None:
+            self._unloader(manager)
+
+    def run(self, *args, **kwargs):
+        return self._runner(*args, **kwargs)
+
+
 def make_plugin(
     runner: Callable,
     loader: Optional[Callable]=None,
@@ -154,28 +209,8 @@ def make_plugin(
     This is useful to make a plugin that doesn't need complex behavior or
     management.
     """
-    name_ = name
-    order_ = order
-
-    class _Plugin(Plugin):
-
-        name = name_ or runner.__name__
-
-        if order_:
-            order = order_
-
-        def load(self, manager):
-            if loader is not None:
-                loader(manager)
-
-        def unload(self, manager):
-            if unloader is not None:
-                unloader(manager)
-
-        def run(self, *args, **kwargs):
-            return runner(*args, **kwargs)
+    return _FactoryPlugin(runner, loader, unloader, name, order)
 
-    return _Plugin()
 
 class PluginManager:
     """Provides a framework for storing, loading, and running plugins.
@@ -183,6 +218,9 @@ class PluginManager:
     This class also provides event hooks for observing plugin activity.
     """
 
+    # Each hook is only emitted if it is truthy, so hooks that report whether
+    # they have listeners skip the emit call when they have none.
+
     #: emits right before a plugin is loaded via the manager.
     plugin_about_to_load = events.EventHook("plugin about to load")
 
@@ -222,6 +260,7 @@ class PluginManager:
                 load into this manager when it is instantiated.
         """
         self.plugins = dict()
+
         if plugins:
             self.load_plugins(plugins)
 
@@ -237,26 +276,36 @@ class PluginManager:
             The returned value for the plugin's `load()` method.
 
         Args:
-            plugin (Plugin)
+            plugin (Plugin): A plugin object, or a plugin class which will be
+                instantiated with no arguments.
         """
+        if inspect.isclass(plugin):
+            plugin = plugin()
+
+        name = plugin.name
+        if type(name) is str:
+            name = sys.intern(name)
 
-        self.plugin_about_to_load.emit(plugin)
+        if self.plugin_about_to_load:
+            self.plugin_about_to_load.emit(plugin)
 
-        if plugin.name in self.plugins:
+        if name in self.plugins:
             raise PluginAlreadyLoaded(
-                f"Plugin \"{plugin.name}\" already loaded!"
+                f"Plugin \"{name}\" already loaded!"
             )
 
         try:
             load_return = plugin.load(self)
         except Exception as e:
-            self.plugin_load_failed.emit(plugin, e)
+            if self.plugin_load_failed:
+                self.plugin_load_failed.emit(plugin, e)
             raise PluginLoadError(
-                f"Failed to load plugin {plugin.name}"
+                f"Failed to load plugin {name}"
             ) from e
         else:
-            self.plugins[plugin.name] = plugin
-            self.plugin_loaded.emit(plugin)
+            self.plugins[name] = plugin
+            if self.plugin_loaded:
+                self.plugin_loaded.emit(plugin)
             return load_return
 
     def load_plugins(self, plugins):
@@ -278,7 +327,7 @@ class PluginManager:
             key (callable): Any callable that accepts a Plugin object and
                 returns a sortable value.
         """
-        return dict(sorted(self.plugins.items(), key=_plugin_order))
+        return _sort_plugins(self.plugins)
 
     def unload_plugin(self, plugin):
         """Unloads the plugin from the manager.
@@ -291,21 +340,25 @@ class PluginManager:
                 this manager.
             PluginUnloadError: If the plugin's `unload` method fails.
         """
-        self.plugin_about_to_unload(plugin)
-        if plugin.name not in self.plugins:
+        name = plugin.name
+        if self.plugin_about_to_unload:
+            self.plugin_about_to_unload.emit(plugin)
+        if name not in self.plugins:
             raise PluginNotLoaded(
-                f"Can't unload the plugin, it has not been loaded: {plugin.name}"
+                f"Can't unload the plugin, it has not been loaded: {name}"
             )
         try:
             unload_return = plugin.unload(self)
         except Exception as e:
-            self.plugin_unload_failed.emit(plugin, e)
+            if self.plugin_unload_failed:
+                self.plugin_unload_failed.emit(plugin, e)
             raise PluginUnloadError(
-                f"Failed to unload plugin {plugin.name}"
+                f"Failed to unload plugin {name}"
             ) from e
         else:
-            self.plugins.pop(plugin.name)
-            self.plugin_unloaded.emit(plugin)
+            self.plugins.pop(name)
+            if self.plugin_unloaded:
+                self.plugin_unloaded.emit(plugin)
             return unload_return
 
     def unload_plugin_by_name(self, plugin_name):
@@ -339,28 +392,47 @@ class PluginManager:
         Returns:
             The return value from the plugin's `run` method.
         """
-        self.plugin_about_to_run.emit(plugin)
+        if self.plugin_about_to_run:
+            self.plugin_about_to_run.emit(plugin)
 
-        if plugin.name not in self.plugins:
+        name = plugin.name
+        stored = self.plugins.get(name)
+        if stored is None:
             msg = ("The plugin is not loaded and can't be run: {}"
-                   "".format(plugin.name))
+                   "".format(name))
             exc = PluginNotLoaded(msg)
-            self.plugin_run_failed.emit(exc, plugin)
+            if self.plugin_run_failed:
+                self.plugin_run_failed.emit(exc, plugin)
             raise exc
 
         try:
-            return_value = plugin.run(*args, **kwargs)
+            return_value = stored.run(*args, **kwargs)
         except Exception as e:
+            if self.plugin_run_failed:
+                self.plugin_run_failed.emit(e, plugin)
             raise PluginRunError from e
 
-        self.plugin_run_completed.emit(plugin)
+        if self.plugin_run_completed:
+            self.plugin_run_completed.emit(plugin)
         return return_value
 
     def run_all_plugins(self, sort=False, *args, **kwargs):
         """Runs all plugins currently loaded in this manager."""
         plugins = self.plugins if not sort else self.sorted_plugins
-        for plugin in plugins.values():
-            self.run_plugin(plugin, *args, **kwargs)
+
+        # Every plugin here is known to be loaded, so this skips run_plugin's
+        # lookup.
+        for plugin in list(plugins.values()):
+            if self.plugin_about_to_run:
+                self.plugin_about_to_run.emit(plugin)
+            try:
+                plugin.run(*args, **kwargs)
+            except Exception as e:
+                if self.plugin_run_failed:
+                    self.plugin_run_failed.emit(e, plugin)
+                raise PluginRunError from e
+            if self.plugin_run_completed:
+                self.plugin_run_completed.emit(plugin)
 
     def run_plugin_by_name(self, name):
         """Runs the plugin, given its name as a string."""
@@ -374,27 +446,32 @@ class PluginManager:
         return self.plugins[plugin_name]
 
 
-def _plugin_order(plugin_tuple):
-    """Gets a tuple for sorting plugins.
+def _sort_plugins(plugins):
+    """Sorts a dict of plugins.
 
     Plugins with an order attribute will be sorted by that attribute.  Plugins
     without an order attribute will be sorted alphabetically AFTER plugins with
     an order attribute.
 
     Args:
-        plugin_tuple (tuple): A name, plugin pair
+        plugins (dict): name, plugin pairs
 
     Returns:
-        tuple of (int, Any) with the int either a 0 if the plugin has an
-            order attribute, or a 1 if it doesn't.  This ensures that plugins
-            without an order attribute are sorted at the end of the list
-            alphabetically.
+        dict of name, plugin pairs in sorted order.
     """
-    name, plugin = plugin_tuple
-    try:
-        return (0, plugin.order, name)
-    except AttributeError:
-        return (1, name)
+    # Sort keys are built once per plugin.  The leading int is 0 if the
+    # plugin has an order attribute, or 1 if it doesn't, which puts plugins
+    # without an order at the end of the list.
+    missing = object()
+    items = list()
+    for name, plugin in plugins.items():
+        order = getattr(plugin, "order", missing)
+        if order is missing:
+            items.append((1, 0, name, plugin))
+        else:
+            items.append((0, order, name, plugin))
+    items.sort()
+    return {name: plugin for _, _, name, plugin in items}
 
 
 # ------------------------------------------------------- Plugin Discovery -- #
@@ -412,52 +489,143 @@ def _plugin_members(obj):
     """
     if Plugin.is_plugin(obj):
         return [obj]
+
+    # A module's namespace is exactly its __dict__, so it can be scanned
+    # directly without the getattr-per-name cost of a generic member search.
+    if inspect.ismodule(obj):
+        return [value for value in vars(obj).values() if Plugin.is_plugin(value)]
     return list(membership.members(obj, predicate=Plugin.is_plugin).values())
 
 
-def in_dir(directory, recursive=False, predicate=None):
+def in_dir(directory, recursive=False, predicate=None, max_workers=1):
     """Discovers all plugins in a given directory's python modules.
 
     If the modules themselves are organized as plugins, they will be returned.
 
+    By default the modules are executed one at a time on the calling thread.
+    If max_workers is greater than 1, they are executed concurrently on that
+    many worker threads, so their top-level code must be thread-safe and
+    must not need the main thread (e.g. signal handlers or maya.cmds calls).
+
+    If not recursive, the listing of modules is cached until the directory is
+    modified, and each module's spec is cached until that module is
+    modified.  The modules are still executed on every call, so each call
+    returns new plugin objects.
+
     Returns:
         list of Plugins
     """
+    # Checking a recursive listing for changes would take a walk of the whole
+    # tree, which costs as much as the listing, so only flat ones are cached.
+    # The predicate is part of the cache key, so unhashable ones can't be.
+    if recursive or not isinstance(predicate, Hashable):
+        names_and_paths = _list_modules(directory, recursive, predicate)
+    else:
+        names_and_paths = _cached_list_modules(
+            directory, predicate, os.stat(directory).st_mtime_ns
+        )
+
+    # Importing is mostly disk reads and compilation, so modules can be
+    # loaded concurrently; plugins are still collected in discovery order.
+    if max_workers > 1 and len(names_and_paths) > 1:
+        max_workers = min(max_workers, len(names_and_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            module_objs = list(executor.map(_load_module, names_and_paths))
+    else:
+        module_objs = [_load_module(pair) for pair in names_and_paths]
+
+    plugins = list()
+    for module_obj in module_objs:
+        if module_obj is not None:
+            plugins.extend(in_module(module_obj))
+    return plugins
+
+
+@lru_cache(maxsize=128)
+def _cached_list_modules(directory, predicate, mtime):
+    """Lists the plugin modules directly in a directory.
+
+    The directory's modification time is part of the cache key, so the
+    listing is refreshed whenever a module is added or removed.
+    """
+    return _list_modules(directory, predicate=predicate)
+
+
+def _list_modules(directory, recursive=False, predicate=None):
+    """Lists the plugin modules in a directory.
+
+    Returns:
+        tuple of (module name, file path) pairs
+    """
     dir_base_name = os.path.basename(directory)
     modules = list()
     if not recursive:
-        for file_ in os.listdir(directory):
-            mod_path = os.path.join(directory, file_)
-            if (os.path.isfile(mod_path)
-                    and not file_.endswith("__init__.py")
-                    and file_.endswith(".py")
-                    and (not predicate or predicate(file_))):
-                modules.append(mod_path)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                file_ = entry.name
+                if (file_.endswith(".py")
+                        and not file_.endswith("__init__.py")
+                        and entry.is_file()
+                        and (not predicate or predicate(file_))):
+                    modules.append(entry.path)
     else:
         for root, dirs, files in os.walk(directory):
             for file_ in files:
-                if (not file_.endswith("__init__.py")
-                        and file_.endswith(".py")
+                if (file_.endswith(".py")
+                        and not file_.endswith("__init__.py")
                         and (not predicate or predicate(file_))):
                     modules.append(os.path.join(root, file_))
 
-    plugins = list()
-
-    for module in modules:
-        mod_name = "__plugin_{directory}_{module}".format(
+    return tuple(
+        ("__plugin_{directory}_{module}".format(
             directory=dir_base_name,
-            module=os.path.splitext(os.path.basename(module))[0]
-        )
-        spec = importlib.util.spec_from_file_location(mod_name, module)
-        if not spec or not spec.loader:
-            continue
-        module_obj = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module_obj)
-        plugins.extend(in_module(module_obj))
-    return plugins
+            module=os.path.basename(module).rpartition(".")[0]
+        ), module)
+        for module in modules
+    )
+
+
+def _load_module(name_and_path):
+    """Loads a module from a (module name, file path) pair.
+
+    Returns:
+        module, or None if no loader could be found for the file.
+    """
+    mod_name, mod_path = name_and_path
+    spec = _spec_from_file(mod_name, mod_path)
+    if not spec or not spec.loader:
+        return None
+    return exec_module(spec)
+
+
+def _spec_from_file(mod_name, mod_path):
+    """Gets a module spec for the given file, reusing it if the file hasn't
+    changed since it was last requested."""
+    return _cached_spec(mod_name, mod_path, os.stat(mod_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _cached_spec(mod_name, mod_path, mtime):
+    """Builds a module spec.  The file's modification time is only part of
+    the cache key, so an edited file gets a fresh spec."""
+    return importlib.util.spec_from_file_location(mod_name, mod_path)
+
+
+def exec_module(spec):
+    """Creates and executes a new module from the given spec.
+
+    Args:
+        spec (importlib.machinery.ModuleSpec)
 
+    Returns:
+        module
+    """
+    module_obj = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module_obj)
+    return module_obj
 
-def in_module(module_obj):
+
+def in_module(module_obj, instantiate=True):
     """Discovers all plugins in a given module object.
 
     Typically, these will be Plugin subclasses, which will be instantiated
@@ -465,16 +633,19 @@ def in_module(module_obj):
 
     Args:
         module_obj (module)
+        instantiate (bool): If False, plugin classes are returned as-is and
+            are instantiated when they are loaded into a PluginManager.
 
     Returns:
-        list of instantiated Plugins
+        list of Plugins
     """
     plugins = _plugin_members(module_obj)
 
     # instantiate any plugin classes
-    for i, plugin in enumerate(plugins):
-        if inspect.isclass(plugin):
-            plugins[i] = plugin()
+    if instantiate:
+        for i, plugin in enumerate(plugins):
+            if inspect.isclass(plugin):
+                plugins[i] = plugin()
 
     return plugins
 
@@ -484,27 +655,48 @@ def in_package(package_obj):
     Args:
         package_obj (module)
     """
-    """Discovers all plugins in an importable python package.
-    Args:
-        package_obj (module)
-        namespace (dict, optional): a dictionary to store the imported modules
-    """
-    found_modules = pkgutil.iter_modules(package_obj.__path__)
+    path_tuple = tuple(package_obj.__path__)
+    list_modules = _iter_package_modules
+    try:
+        mtime_tuple = tuple(os.stat(path).st_mtime_ns for path in path_tuple)
+    except OSError:
+        # e.g. a package imported from a zip file, or a stale path entry;
+        # these can't be checked for changes, so they aren't cached
+        mtime_tuple = None
+        list_modules = _iter_package_modules.__wrapped__
+    found_modules = list_modules(package_obj.__name__, path_tuple, mtime_tuple)
     plugins = []
-    for _, name, is_pkg in found_modules:
-        full_name = "{}.{}".format(package_obj.__name__, name)
-        if is_pkg:
-            continue
-        try:
-            module = importlib.import_module(full_name)
-            plugins.extend(in_module(module))
-        except ImportError:
-            pass
+    for full_name in found_modules:
+        # modules that are already imported are reused as-is
+        module = sys.modules.get(full_name)
+        if module is None:
+            try:
+                module = importlib.import_module(full_name)
+            except ImportError:
+                continue
+        plugins.extend(in_module(module))
     return plugins
 
 
+@lru_cache(maxsize=128)
+def _iter_package_modules(package_name, path_tuple, mtime_tuple):
+    """Lists the full names of the non-package modules in a package.
+
+    The modification times of the package's paths are part of the cache key,
+    so the listing is refreshed whenever a module is added or removed.
+
+    Returns:
+        tuple of str
+    """
+    return tuple(
+        "{}.{}".format(package_name, name)
+        for _, name, is_pkg in pkgutil.iter_modules(path_tuple)
+        if not is_pkg
+    )
+
+
 def in_plugins_dir(module_file, dir_name="plugins", recursive=False,
-                   predicate=None):
+                   predicate=None, max_workers=1):
     """Discovers all plugins in a sibling directory to the given file.
 
     The directory does not have to be an importable python package.
@@ -522,6 +714,9 @@ def in_plugins_dir(module_file, dir_name="plugins", recursive=False,
         predicate (callable): A function that takes a file path as a str
             and returns a boolean.
 
+        max_workers (int): The number of threads used to execute the plugin
+            modules.  See in_dir.
+
 
     Example:
         # the package hierarchy looks like this:
@@ -539,12 +734,13 @@ def in_plugins_dir(module_file, dir_name="plugins", recursive=False,
                 pluggable.in_plugins_dir, __name__
             )
     """
-    dir_ = os.path.split(module_file)[0]
+    dir_ = os.path.dirname(module_file)
     plugin_dir = os.path.join(dir_, dir_name)
-    return in_dir(plugin_dir, recursive=recursive)
+    return in_dir(plugin_dir, recursive=recursive, predicate=predicate,
+                  max_workers=max_workers)
 
 
-def in_env_path(env_variable, recursive=False, predicate=None):
+def in_env_path(env_variable, recursive=False, predicate=None, max_workers=1):
     """Discovers all plugins directories in a PATH-like environment variable
 
     The directories do not have to be an importable python package.
@@ -553,24 +749,59 @@ def in_env_path(env_variable, recursive=False, predicate=None):
         env_variable (str): The name of an environment variable to read.
         predicate (callable): A function that takes a file path as a str
             and returns a boolean.
+        max_workers (int): The number of threads used to execute the plugin
+            modules.  See in_dir.
     """
     paths = os.environ[env_variable].split(os.pathsep)
-    from itertools import chain
-    return list(chain(in_dir(path, recursive=recursive, predicate=predicate)
-                for path in paths))
+    return list(chain.from_iterable(
+        in_dir(path, recursive=recursive, predicate=predicate,
+               max_workers=max_workers)
+        for path in paths
+    ))
+
+
+#: Plugin lists produced by finder callbacks, keyed on the finder and the
+#: arguments it was called with.
+_DISCOVERED_SOURCES: Dict[Tuple[Finder, str, str], List["Plugin"]] = {}
 
 
-def finder_callback(finder: Finder, *args, **kwargs):
+def finder_callback(finder: Finder, *args, cache: bool=False, **kwargs):
     """FACTORY: Makes a callback that will be called with the given arguments.
     Args:
         finder (callable): A function or other callable that returns Plugins
         *args, **kwargs: Any positional or keyword arguments that you want to
             pass in to the callback when it is evaluated.
+        cache (bool): If True, the plugins found by the first call are
+            remembered and returned by every later call of any callback made
+            with the same finder and arguments, until clear_finder_cache is
+            called.  Note that every call then returns the same plugin
+            objects, so they must not be loaded into more than one manager.
     """
-    @wraps(finder)
-    def cbk():
-        return finder(*args, **kwargs)
-    return cbk
+    # The callback is a functools.partial rather than a closure: it is
+    # called in C, and as a non-descriptor it can also be stored as a class
+    # attribute without being bound as a method.
+    if cache:
+        key = (finder, repr(args), repr(sorted(kwargs.items())))
+        cbk = partial(_find_cached, key, finder, args, kwargs)
+    else:
+        cbk = partial(finder, *args, **kwargs)
+    return update_wrapper(cbk, finder)
+
+
+def _find_cached(key, finder, args, kwargs):
+    """Calls the finder, or returns a copy of the plugins it found the last
+    time it was called with the same arguments."""
+    try:
+        return list(_DISCOVERED_SOURCES[key])
+    except KeyError:
+        plugins = list(finder(*args, **kwargs))
+        _DISCOVERED_SOURCES[key] = plugins
+        return list(plugins)
+
+
+def clear_finder_cache():
+    """Forgets the plugins remembered by cached finder callbacks."""
+    _DISCOVERED_SOURCES.clear()
 
 
 # ------------------------------------------------------ Custom Exceptions -- #
@@ -6,6 +6,8 @@ will use when released, but the package has not yet been released.
 
 """
 
+import functools
+import itertools
 import os
 from pathlib import Path
 from typing import Union
@@ -48,17 +50,22 @@ class RequirementsList:
         base_requires = getattr(pkg, "requires") or list()
         inst.base = _to_str(base_requires)
 
-        build_requires = list()
-        build_requires.extend(getattr(pkg, "build_requires") or list())
-        build_requires.extend(getattr(pkg, "private_build_requires") or list())
-        inst.build = _to_str(build_requires)
+        inst.build = [
+            str(req) for req in (
+                *(getattr(pkg, "build_requires") or ()),
+                *(getattr(pkg, "private_build_requires") or ()),
+            )
+        ]
 
-        variant_requires = getattr(pkg, "variants") or list()
-        inst.variant = _to_str(variant_requires)
+        # each variant is itself a list of requirements
+        inst.variants = [
+            _to_str(variant) for variant in (getattr(pkg, "variants") or ())
+        ]
 
+        # a test is either a bare command string or a dict of test attributes
         tests = getattr(pkg, "tests") or dict()
-        for test_name in tests:
-            requires = tests.get("requires", False)
+        for test_name, test in tests.items():
+            requires = test.get("requires") if isinstance(test, dict) else None
             if requires:
                 inst.tests[test_name] = _to_str(requires)
         return inst
@@ -83,21 +90,48 @@ class RequirementsList:
                 requirements from. Defaults to None. Ignored if "tests" is
                 False.
         """
-        all_requirements = list()
-        all_requirements += self.base if base else list()
-        all_requirements += self.build if build else list()
-
+        # gather the requirement lists first, then flatten them in one pass
+        parts = list()
+        if base:
+            parts.append(self.base)
+        if build:
+            parts.append(self.build)
         if variants:
-            for index in variant_indexes:
-                all_requirements += self.variants[index]
-
+            parts.extend(self.variants[index] for index in variant_indexes)
         if tests:
-            for test_name in test_names:
-                all_requirements += self.tests[test_name]
+            parts.extend(self.tests[test_name] for test_name in test_names)
 
-        return all_requirements
+        return list(itertools.chain.from_iterable(parts))
 
     @classmethod
     def from_path(cls, path: PathLike):
-        package = get_developer_package(path)
+        abspath = os.fspath(Path(path).resolve())
+        package = _cached_developer_package(abspath, _package_file_mtime(abspath))
         return cls.from_package(package)
+
+
+#: The package file names rez looks for in a developer package, in the order
+#: it looks for them.
+_PACKAGE_FILE_NAMES = ("package.py", "package.yaml", "package.txt")
+
+
+def _package_file_mtime(abspath: str) -> Union[int, None]:
+    """Returns the modification time of the package file rez will load from
+    the given directory, or None if it has no package file."""
+    for file_name in _PACKAGE_FILE_NAMES:
+        try:
+            return os.stat(os.path.join(abspath, file_name)).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_developer_package(abspath: str, mtime: Union[int, None]
+                              ) -> DeveloperPackage:
+    """Loads a developer package, reusing it until its package file changes.
+
+    The modification time is only part of the cache key, so an edited package
+    file gets a fresh cache entry.
+    """
+    return get_developer_package(abspath)
@@ -1,18 +1,21 @@
 import argparse
+import importlib
 import os
 import sys
 
-import rezifier
+# rezifier is only imported once a command has parsed its arguments, so help
+# and usage errors don't pay for its import.  Package types are therefore
+# registered by name and resolved after parsing.
 
+#: maps a "--type" command-line argument to a (module, class name) pair.
+_PKG_TYPE_SPECS = {
+    "empty": ("rezifier", "Rezifier"),
+    "py": ("rezifier", "PyPackageRezifier"),
+    "util": ("rezifier", "UtilityRezifier"),
+}
 
-def new(args):
 
-    # maps a "--type" command-line argument to default package data.
-    default_pkg_map = {
-        "empty": rezifier.Rezifier,
-        "py": rezifier.PyPackageRezifier,
-        "util": rezifier.UtilityRezifier,
-    }
+def new(args):
 
     # MAKE PARSER ----------------------------------------------------------- #
     parser = argparse.ArgumentParser()
@@ -20,7 +23,7 @@ def new(args):
     parser.add_argument("-d", "--target-dir")
     parser.add_argument(
         "-t", "--type",
-        choices=default_pkg_map.keys()
+        choices=_PKG_TYPE_SPECS.keys()
     )
     parser.add_argument("-i", "--initialize", action="store_true")
 
@@ -28,7 +31,8 @@ def new(args):
     parsed = parser.parse_args(args)
     name = parsed.name
     target_dir = parsed.target_dir or os.getcwd()
-    pkg_type = default_pkg_map[parsed.type]
+    mod_name, cls_name = _PKG_TYPE_SPECS[parsed.type]
+    pkg_type = getattr(importlib.import_module(mod_name), cls_name)
 
     # MAKE NEW DEV PACKAGE -------------------------------------------------- #
     rezifier_ = pkg_type(pkg_name=name, pkg_dir=target_dir)
@@ -42,6 +46,7 @@ def convert(args):
     parser.add_argument("-p", "--parent-dir")
     parser.add_argument("-d", "--target-dir")
     parser.add_argument("-i", "--initialize", action="store_true")
+    parser.add_argument("-l", "--link", action="store_true")
 
     # PARSE AND PROCESS ARGS ------------------------------------------------ #
     parsed = parser.parse_args(args)
@@ -51,8 +56,10 @@ def convert(args):
     target_dir = parsed.target_dir or os.path.join(os.getcwd(), "rezified")
 
     # MAKE DEV PACKAGE ------------------------------------------------------ #
+    rezifier = importlib.import_module("rezifier")
     rezifier_ = rezifier.PyPackageRezifier.from_existing(
-        py_package_path, pkg_name=py_package_name, pkg_dir=target_dir
+        py_package_path, pkg_name=py_package_name, pkg_dir=target_dir,
+        link_payload=parsed.link
     )
     rezifier_.run()
 
@@ -4,38 +4,30 @@ Tools for making new Rez recipes (aka source packages, aka developer packages)
 
 from __future__ import annotations
 from typing import Callable
+from typing import TYPE_CHECKING
 from typing import Union
 
 import os
+import shutil
 import stat
 import enum
 import inspect
+import io
 import uuid
-import re
-from pathlib import Path
-
-from rez import packages
-from rez import developer_package
-from rez import package_maker
-from rez import serialise
-from rez import package_serialise
-from rez import resolved_context
-from rez.utils import filesystem
-
-from tqdm import tqdm
-
-import isort
-import isort.stdlibs.all
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePath
 
 import console_utils
 
+# rez, isort and tqdm are imported where they are used, so that importing this
+# module (e.g. to print command-line help) doesn't pay for their import trees.
+if TYPE_CHECKING:
+    from rez.package_maker import PackageMaker
+    from rez.developer_package import DeveloperPackage
+
 # typing
 PathLike = Union[str, os.PathLike, Path]
 
-# aliases
-PackageMaker = package_maker.PackageMaker
-DeveloperPackage = developer_package.DeveloperPackage
-
 __all__ = ["Rezifier", "PyPackageRezifier", "UtilityRezifier", "make_package"]
 
 # ----------------------------------------------------------------- CONSTANTS #
@@ -54,9 +46,32 @@ BAT_ERR_CHECK = (
 #: (str) batch script to delete the temporary build directory
 BAT_CLEAN_BUILD = "rd /s /q .\\build\n"
 
+#: (str) batch script to build a Rez package
+BAT_BUILD = "".join(("rez-build\n", BAT_ERR_CHECK))
+
+#: (str) batch script to install a Rez package
+BAT_INSTALL = "".join(
+    ("rez-build --install --clean\n", BAT_ERR_CHECK, BAT_CLEAN_BUILD)
+)
+
+#: (str) batch script to release a Rez package
+BAT_RELEASE = "".join(("rez-release\n", BAT_ERR_CHECK, BAT_CLEAN_BUILD))
 
-#: (re.Pattern) matches either path/to/tests/ or path/to/test/
-TEST_DIR_PATTERN = re.compile(f"\\{os.path.sep}(tests?)\\{os.path.sep}")
+
+#: (int) permissions for new package files: read-only for everyone.  These
+#: aren't supported on Windows, see
+#: https://docs.python.org/2/library/os.html#os.chmod
+_PKG_FILE_MODE = (
+    None if os.name == "nt" else (stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+)
+
+#: (list[list[str]]) the platform/arch variant of the current machine, set on
+#: first use by UtilityRezifier._get_implicit_variant
+_IMPLICIT_VARIANT = None
+
+
+#: (frozenset[str]) names of directories that hold tests
+TEST_DIR_NAMES = frozenset(("test", "tests"))
 
 
 # The source code of this function is used to create a base build.py file for
@@ -86,6 +101,11 @@ def _buildpy_source():
         build(source_path, build_path)
 
 
+#: (str) the dedented source of _buildpy_source, read on first use by
+#: UtilityRezifier.make_build_py
+_BUILDPY_TEMPLATE = None
+
+
 # ------------------------------------------------------------- REZIFICATIONS #
 
 class Rezifier:
@@ -121,6 +141,7 @@ class Rezifier:
         self.pkg_name = pkg_name
         self.pkg_dir = pkg_dir
         self.pkg_sub_dir = os.path.join(self.pkg_dir, self.pkg_name)
+        self._pkg_sub_path = PurePath(self.pkg_sub_dir)
         self.data = data or dict()
         self.git_initialize = git_initialize
         self.repo_name = repo_name
@@ -140,9 +161,11 @@ class Rezifier:
 
         data = self.get_data()
         data.update(self.data)
+
+        from rez import package_maker
         self.pkg_maker = package_maker.PackageMaker(self.pkg_name, data=data)
 
-        self.pkg_path = os.path.join(self.pkg_sub_dir, "package.py")
+        self.pkg_path = str(self._pkg_sub_path / "package.py")
 
         make_package(self.pkg_path, self.pkg_maker)
 
@@ -188,29 +211,15 @@ class Rezifier:
 
     def make_build_bat(self):
         """Make a standard bat file for building a Rez package."""
-        self.make_bat(
-            "rez_build.bat",
-            "rez-build\n"
-            + BAT_ERR_CHECK
-        )
+        self.make_bat("rez_build.bat", BAT_BUILD)
 
     def make_install_bat(self):
         """Make a standard bat file for installing a Rez package."""
-        self.make_bat(
-            "rez_install.bat",
-            "rez-build --install --clean\n"
-            + BAT_ERR_CHECK
-            + BAT_CLEAN_BUILD
-        )
+        self.make_bat("rez_install.bat", BAT_INSTALL)
 
     def make_release_bat(self):
         """Make a standard bat file for releasing a Rez package."""
-        self.make_bat(
-            "rez_release.bat",
-            "rez-release\n"
-            + BAT_ERR_CHECK
-            + BAT_CLEAN_BUILD
-        )
+        self.make_bat("rez_release.bat", BAT_RELEASE)
 
     def make_bat(self, name: str, contents: str):
         """Make a `.bat` file with the given contents.
@@ -219,8 +228,7 @@ class Rezifier:
             name (str): The name of the batch file (including extension).
             contents (str): The contents of the batch file.
         """
-        with open(os.path.join(self.pkg_sub_dir, name), "w") as release_bat:
-            release_bat.write(contents)
+        _write_if_changed(self._pkg_sub_path / name, contents)
 
     def initialize(self):
         """A hook for initializing the package as a git repository.
@@ -240,8 +248,24 @@ class Rezifier:
 
 class PyPackageRezifier(Rezifier):
     """Rezifier object for packages containing Python modules."""
-    def __init__(self, *args, **kwargs):
+
+    #: (frozenset[str]) names of standard library modules, snapshotted from
+    #: isort the first time a requirement is validated.
+    _STDLIB: frozenset[str] | None = None
+
+    def __init__(self, *args, link_payload: bool=False, **kwargs):
+        """
+        Args:
+            link_payload (bool, optional): True if the payload should be
+                hard-linked to the source rather than copied, when both are on
+                the same filesystem.  Linked files are shared, so editing the
+                payload also edits the source.  Defaults to False.
+
+            *args, **kwargs: See Rezifier.
+        """
         super().__init__(*args, **kwargs)
+        self.link_payload = link_payload
+        self._payload_path = self._pkg_sub_path / "python" / self.pkg_name
         self.source: PathLike = None
         self.test_dir = None
 
@@ -282,9 +306,13 @@ class PyPackageRezifier(Rezifier):
 
     def _valid_requirement(self, require_name: str) -> bool:
         """Returns True if the given requirement is valid."""
+        cls = type(self)
+        if cls._STDLIB is None:
+            import isort.stdlibs.all
+            cls._STDLIB = frozenset(isort.stdlibs.all.stdlib)
         return (
             not require_name.startswith("_")
-            and require_name not in isort.stdlibs.all.stdlib
+            and require_name not in cls._STDLIB
             and require_name != self.pkg_name
         )
 
@@ -298,40 +326,47 @@ class PyPackageRezifier(Rezifier):
         if not self.source:
             return (None, None, None)
 
-        py_files, test_files, test_dirs = self.collect_python_files()
-
-        non_test_requirements = self.collect_imports(
-            py_files,
-            validator=self._valid_requirement
-        )
-
-        test_requirements = self.collect_imports(
-            test_files,
-            validator=self._valid_requirement
-        )
+        # The source tree is walked once, and each file is handed to a parser
+        # process as soon as it's found, routed by whether it's a test file.
+        test_dirs = []
+        is_test_flags = []
+
+        def py_files():
+            for py_file, is_test in self.collect_python_files(test_dirs):
+                is_test_flags.append(is_test)
+                yield py_file
+
+        non_test_names = set()
+        test_names = set()
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_imports_of, py_files(), chunksize=32)
+            # map has consumed the walk by now, so every flag is recorded
+            results = _progress(results, "Parsing Dependencies",
+                                total=len(is_test_flags))
+            for is_test, mod_names in zip(is_test_flags, results):
+                if is_test:
+                    test_names.update(mod_names)
+                else:
+                    non_test_names.update(mod_names)
+
+        valid = self._valid_requirement
+        non_test_requirements = [n for n in non_test_names if n and valid(n)]
+        test_requirements = [n for n in test_names if n and valid(n)]
         return non_test_requirements, test_requirements, test_dirs
 
-    def collect_python_files(self) -> list[str]:
+    def collect_python_files(self, test_dirs: list=None):
         """Collects all python source files recursively in the directory.
 
-        Returns:
-            list[str]: Full paths to each non-test python file in the directory
-            and all descendant directories.
+        Args:
+            test_dirs (list, optional): If given, the full path to every test
+                directory found is appended to this list.
+
+        Yields:
+            tuple[str, bool]: The full path to each python file in the
+            directory and all descendant directories, and whether it's in a
+            test directory.
         """
-        py_files = []
-        test_files = []
-        test_dirs = []
-        valid_test_names = ("test", "tests")
-        for root, dirs, files in os.walk(self.source):
-            full_files = [os.path.join(root, f) for f in files if f.endswith(".py")]
-            if os.path.split(root)[1] in valid_test_names:
-                test_files.extend(full_files)
-            else:
-                py_files.extend(full_files)
-            test_dirs.extend(
-                [os.path.join(root, dir_) for dir_ in dirs if dir_ in valid_test_names]
-            )
-        return py_files, test_files, test_dirs
+        yield from _iter_python_files(self.source, TEST_DIR_NAMES, test_dirs)
 
     @staticmethod
     def collect_imports(py_files: list[str],
@@ -354,24 +389,41 @@ class PyPackageRezifier(Rezifier):
         Returns:
             list[str]: A list of all detected dependencies.
         """
+        # Parsing is CPU-bound and independent per file, so it is spread
+        # across processes.  Validation happens once per unique name.
         requires = set()
-        for py_file in tqdm(py_files, "Parsing Dependencies"):
-            imports = isort.api.find_imports_in_file(py_file)
-            dependencies = set()
-            for import_ in imports:
-                mod_name = import_.module.split(".")[0]
-                if mod_name and validator and validator(mod_name):
-                    dependencies.add(mod_name)
-                elif mod_name and not validator:
-                    dependencies.add(mod_name)
-            requires = set.union(requires, dependencies)
-        return list(requires)
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_imports_of, py_files, chunksize=32)
+            for mod_names in _progress(results, "Parsing Dependencies",
+                                       total=len(py_files)):
+                requires.update(mod_names)
+        requires.discard("")
+        if validator is None:
+            return list(requires)
+        return [mod_name for mod_name in requires if validator(mod_name)]
 
     def make_payloads(self):
-        """Copy the payload from the original source into the package."""
-        payload_path = os.path.join(self.pkg_sub_dir, "python", self.pkg_name)
+        """Copy the payload from the original source into the package.
+
+        If link_payload is True and the source and the package are on the
+        same filesystem, payload files are hard-linked rather than copied.
+        """
+        payload_path = str(self._payload_path)
         os.makedirs(payload_path, exist_ok=True)
         if self.source is not None:
+            if (self.link_payload and os.stat(self.source).st_dev
+                    == os.stat(payload_path).st_dev):
+                try:
+                    shutil.copytree(self.source, payload_path,
+                                    copy_function=_link_file,
+                                    dirs_exist_ok=True)
+                    return
+                except (OSError, shutil.Error):
+                    # e.g. the filesystem doesn't support hard links
+                    pass
+            # files linked by this or an earlier run must not be copied onto,
+            # as that would copy each source file onto itself
+            _unlink_links_to(self.source, payload_path)
             console_utils.copytree(self.source, payload_path)
         else:
             init_path = os.path.join(payload_path, "__init__.py")
@@ -398,7 +450,7 @@ class UtilityRezifier(Rezifier):
 
     def make_payloads(self):
         """Makes a "bin" payload path"""
-        payload_path = os.path.join(self.pkg_sub_dir, "bin")
+        payload_path = str(self._pkg_sub_path / "bin")
         os.makedirs(payload_path, exist_ok=True)
 
     def get_data(self) -> dict:
@@ -429,29 +481,44 @@ class UtilityRezifier(Rezifier):
         This function will typically be used as an "accessory maker" callback
         when using a Rezifier object.
         """
-        build_py_path = os.path.join(self.pkg_sub_dir, "build.py")
-        py_str = inspect.getsource(_buildpy_source)
-        py_lines = py_str.split("\n")[1:]
+        global _BUILDPY_TEMPLATE
+        build_py_path = self._pkg_sub_path / "build.py"
 
-        # strip the indent from the source code
-        revised_py_str = "\n".join(
-            [line[4:] for line in py_lines]
-        )
+        if _BUILDPY_TEMPLATE is None:
+            py_lines = inspect.getsource(_buildpy_source).split("\n")[1:]
+
+            # strip the indent from the source code
+            _BUILDPY_TEMPLATE = "\n".join(line[4:] for line in py_lines)
 
         # add pkg-specific values
-        revised_py_str = revised_py_str.format(pkg_name=self.pkg_name)
+        revised_py_str = _BUILDPY_TEMPLATE.format(pkg_name=self.pkg_name)
 
-        with open(build_py_path, mode="w") as py_build_file:
-            py_build_file.write(revised_py_str)
+        _write_if_changed(build_py_path, revised_py_str)
 
     @staticmethod
     def _get_implicit_variant():
-        empty_ctx = resolved_context.ResolvedContext(
-            package_requests=["arch", "platform"]
-        )
-        platform = empty_ctx.get_resolved_package("platform")
-        arch = empty_ctx.get_resolved_package("arch")
-        return [[platform.qualified_package_name, arch.qualified_package_name]]
+        global _IMPLICIT_VARIANT
+        if _IMPLICIT_VARIANT is not None:
+            return [list(variant) for variant in _IMPLICIT_VARIANT]
+
+        # rez already knows the current platform and arch; only resolve a
+        # context (which runs the solver) if that information is unavailable
+        try:
+            from rez.system import system
+            variant = [f"platform-{system.platform}", f"arch-{system.arch}"]
+        except Exception:
+            from rez import resolved_context
+            empty_ctx = resolved_context.ResolvedContext(
+                package_requests=["arch", "platform"]
+            )
+            platform = empty_ctx.get_resolved_package("platform")
+            arch = empty_ctx.get_resolved_package("arch")
+            variant = [
+                platform.qualified_package_name, arch.qualified_package_name
+            ]
+
+        _IMPLICIT_VARIANT = [variant]
+        return [list(variant) for variant in _IMPLICIT_VARIANT]
 
 
 def make_package(pkg_path: PathLike, pkg: PackageMaker) -> str:
@@ -466,24 +533,135 @@ def make_package(pkg_path: PathLike, pkg: PackageMaker) -> str:
     Returns:
         str: The path to the new package file
     """
-    package_file_mode = (
-        None if os.name == "nt" else
-        # These aren't supported on Windows
-        # https://docs.python.org/2/library/os.html#os.chmod
-        (stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
-    )
+    from rez import serialise
+    from rez import package_serialise
+    from rez.utils import filesystem
+
     package_obj = pkg.get_package()
     package_obj.validate_data()
     package_data = package_obj.data
-    package_format = serialise.FileFormat.py
+
+    # serialise in memory first, so an unchanged package file isn't rewritten
+    buf = io.StringIO()
+    package_serialise.dump_package_data(
+        package_data, buf=buf, format_=serialise.FileFormat.py
+    )
+    contents = buf.getvalue()
+    if _is_unchanged(pkg_path, contents):
+        return pkg_path
+
     base_path = os.path.dirname(pkg_path)
     os.makedirs(base_path, exist_ok=True)
 
     with filesystem.make_path_writable(base_path):
         open_pkg = serialise.open_file_for_write(
-            pkg_path, mode=package_file_mode
+            pkg_path, mode=_PKG_FILE_MODE
         )
         with open_pkg as package_file:
-            package_serialise.dump_package_data(
-                package_data, buf=package_file, format_=package_format
-            )
+            package_file.write(contents)
+    return pkg_path
+
+
+def _is_unchanged(path: PathLike, contents: str) -> bool:
+    """True if the file at path already holds exactly the given contents."""
+    try:
+        with open(path) as file_:
+            return file_.read() == contents
+    except FileNotFoundError:
+        return False
+
+
+def _write_if_changed(path: PathLike, contents: str) -> bool:
+    """Writes contents to a text file, unless it already holds them.
+
+    Skipping identical writes keeps mtimes stable across repeated runs, so
+    nothing downstream sees a change that didn't happen.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    if _is_unchanged(path, contents):
+        return False
+    with open(path, "w") as file_:
+        file_.write(contents)
+    return True
+
+
+def _link_file(src: PathLike, dst: PathLike) -> PathLike:
+    """Hard-links src to dst, replacing any other file already at dst.
+
+    Used as a copytree copy_function, so re-running into an existing package
+    relinks changed files and leaves already-linked ones alone.
+    """
+    if os.path.lexists(dst):
+        if os.path.samefile(src, dst):
+            return dst
+        os.unlink(dst)
+    os.link(src, dst)
+    return dst
+
+
+def _unlink_links_to(source: PathLike, target: PathLike):
+    """Removes each file under target that is the same file as its
+    counterpart under source, i.e. a hard link to it."""
+    for root, _, files in os.walk(target):
+        for file_ in files:
+            dst = os.path.join(root, file_)
+            src = os.path.join(source, os.path.relpath(dst, target))
+            if os.path.exists(src) and os.path.samefile(src, dst):
+                os.unlink(dst)
+
+
+def _iter_python_files(root: PathLike, test_names: frozenset[str],
+                       test_dirs: list=None, in_test_dir: bool=False):
+    """Recursively yields (path, is_test) for each python file under root.
+
+    A file is a test file if any directory between it and the top-level root
+    is a test directory, e.g. both path/to/tests/ and path/to/tests/data/.
+
+    Uses os.scandir, whose entries already know whether they are directories,
+    so no extra stat or path join is needed per entry.  Directories that
+    can't be read are skipped, as os.walk does.
+    """
+    is_test = in_test_dir or os.path.basename(root) in test_names
+    sub_dirs = []
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry)
+            elif entry.name.endswith(".py"):
+                yield entry.path, is_test
+
+    # recurse once the scandir handle is closed, so deep trees don't hold
+    # a file descriptor open per level
+    for entry in sub_dirs:
+        if test_dirs is not None and entry.name in test_names:
+            test_dirs.append(entry.path)
+        yield from _iter_python_files(entry.path, test_names, test_dirs,
+                                      in_test_dir=is_test)
+
+
+def _imports_of(py_file: PathLike) -> set[str]:
+    """Returns the top-level names of the modules a python file imports.
+
+    Names are deduplicated here, in the worker, so repeated imports within a
+    file aren't sent back to the parent process.
+    """
+    import isort
+    return {
+        import_.module.split(".", 1)[0]
+        for import_ in isort.api.find_imports_in_file(py_file)
+    }
+
+
+def _progress(iterable, description: str, total: int=None):
+    """Wraps an iterable in a tqdm progress bar, if tqdm is installed."""
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return iterable
+    return tqdm(iterable, description, total=total)
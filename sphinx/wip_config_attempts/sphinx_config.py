@@ -23,9 +23,6 @@ Example:
 import os
 import sys
 
-# -- Third-Party Extensions --------------------------------------------------
-import sphinx_rtd_theme
-
 
 # -- Project information -----------------------------------------------------
 project = "Project Name"
@@ -75,7 +72,12 @@ autodoc_mock_imports = []
 autoclass_content = "both"
 
 # Add any paths that contain templates here, relative to this directory.
-templates_path = ["_templates", os.environ["SPHINX_BASE_TEMPLATE_PATH"]]
+# The shared base templates are only added if their location is configured.
+templates_path = [
+    path for path in
+    ["_templates", os.environ.get("SPHINX_BASE_TEMPLATE_PATH")]
+    if path
+]
 
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
@@ -93,7 +95,11 @@ html_theme = "sphinx_rtd_theme"
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
-html_static_path = ["_static", os.environ["SPHINX_BASE_STATIC_PATH"]]
+html_static_path = [
+    path for path in
+    ["_static", os.environ.get("SPHINX_BASE_STATIC_PATH")]
+    if path
+]
 
 # Style type for any code snippets
 pygments_style = "tango"